@@ -5,6 +5,13 @@ LENV - Project-scoped Linux environments for Windows developers
 __version__ = '1.2.1'
 __author__ = "Pranav Digraskar"
 
-from .core import LENV
+__all__ = ["LENV"]
 
-__all__ = ["LENV"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Import the core module on first use, so `lenv --help` / `--version`
+    # don't pay for it (PEP 562 module __getattr__).
+    if name == "LENV":
+        from .core import LENV
+        return LENV
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,4 @@
 import argparse
-from .core import LENV
 import sys
 from . import __version__
 
@@ -86,6 +85,9 @@ def main():
 
     
     args = parser.parse_args()
+
+    # Deferred so that --help/--version never import the core module graph.
+    from .core import LENV
     
     try:
         if args.command is None:
@@ -1,18 +1,19 @@
 import subprocess
+import functools
 import os
 import sys
 import re
 import json
-import shutil
+import threading
 from pathlib import Path
-from datetime import datetime, timezone
-import hashlib
 import time
 
 # NOTE: heavy modules (urllib.request, tarfile, tempfile) are imported lazily
 # inside the functions that need them. They pull in http.client/email.* and cost
 # ~60-70ms of interpreter startup — most of the gap between `lenv run` and a
-# compiled CLI — but are only used on the download/validate paths.
+# compiled CLI — but are only used on the download/validate paths. hashlib and
+# shutil are lazy too: `lenv run`/`status` on an initialised project never
+# hash or copy anything.
 
 # ─── Network isolation constants ───────────────────────────────────────────────
 LENV_BRIDGE   = "lenv-br0"
@@ -29,69 +30,192 @@ _INSTANCE_NAME_RE = re.compile(r"^lenv-[A-Za-z0-9._-]+-[0-9a-f]{8}$")
 # must be validated before use.
 _PACKAGE_NAME_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._+:-]*$")
 
+# Rootfs downloads are streamed straight to disk in 1 MiB reads; a dropped
+# connection is resumed with a Range request up to _DOWNLOAD_RETRIES times.
+_DOWNLOAD_CHUNK   = 1024 * 1024
+_DOWNLOAD_RETRIES = 3
+
+# Without curl/wget, large files are fetched over several connections at once
+# (one ranged GET each), since a single TCP stream rarely fills a high-latency
+# link. Files below the threshold are not worth the extra round trips.
+_DOWNLOAD_CONNECTIONS   = 4
+_PARALLEL_MIN_BYTES     = 8 * 1024 * 1024
+
+
+def _format_size(size_bytes):
+    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+        if size_bytes < 1024 or unit == 'TB':
+            return f"{size_bytes:.2f} {unit}"
+        size_bytes /= 1024
+
+
+def _preallocate(f, size):
+    """
+    Reserve `size` bytes for file `f` before writing into it, so the file is
+    laid out in one go instead of being extended (and possibly fragmented)
+    chunk by chunk. truncate() is SetEndOfFile on Windows, which allocates
+    the clusters on NTFS; POSIX systems use posix_fallocate when available.
+    """
+    f.flush()
+    try:
+        os.posix_fallocate(f.fileno(), 0, size)
+    except (AttributeError, OSError):
+        f.truncate(size)
+
+
+class _Progress:
+    """Download progress line, throttled to ~20 updates (or one per 5 MiB
+    when the size is unknown). Safe to share between download threads."""
+
+    def __init__(self, total=None):
+        self.total = total
+        self.done  = 0
+        self._shown = -1
+        self._lock  = threading.Lock()
+
+    def add(self, n):
+        with self._lock:
+            self.done += n
+            if self.total:
+                step = self.done * 20 // self.total
+            else:
+                step = self.done // (5 * _DOWNLOAD_CHUNK)
+            if step == self._shown:
+                return
+            self._shown = step
+            if self.total:
+                sys.stdout.write(f"\r   Progress: {min(100, step * 5)}%")
+            else:
+                sys.stdout.write(f"\r   Downloaded: {_format_size(self.done)}")
+            sys.stdout.flush()
+
 
 class LENV:
     def __init__(self, project_path=None, distro_set=None, rootfs_path=None, build=None):
         self.project_path = project_path or os.getcwd()
+        # absolute(), not resolve(): resolving would turn mapped/subst drives
+        # into UNC paths, which have no /mnt/<drive> equivalent inside WSL.
+        self._project_abs = Path(self.project_path).absolute()
 
         # The folder name becomes part of the WSL instance name — restrict it
         # to characters that are safe for WSL distro names and shell usage.
         raw_name = os.path.basename(self.project_path) or "project"
         self.project_name = re.sub(r"[^A-Za-z0-9._-]+", "-", raw_name).strip("-.") or "project"
 
-        self._path_hash = hashlib.md5(
-            str(Path(self.project_path).absolute()).encode()
-        ).hexdigest()[:8]
-
-        self.instance_name = f"lenv-{self.project_name}-{self._path_hash}"
         self.config_dir  = Path(self.project_path) / ".lenv"
         self.config_file = self.config_dir / "config.json"
-
-        self.lenv_home = Path.home() / ".lenv"
-        self.lenv_home.mkdir(exist_ok=True)
-
+        self._config     = None            # parsed config.json, read once
+        self._config_found = False         # whether config.json exists
+
+        # Reuse the instance name recorded by `lenv init`, so reruns skip the
+        # path hash entirely. Only a name matching the lenv scheme is trusted.
+        stored_name = self._read_config().get("instance_name")
+        if stored_name and _INSTANCE_NAME_RE.fullmatch(stored_name):
+            self.instance_name = stored_name
+        else:
+            import hashlib      # lazy: only needed before `lenv init` has run
+            path_hash = hashlib.blake2b(
+                str(self._project_abs).encode(), digest_size=4
+            ).hexdigest()
+            self.instance_name = f"lenv-{self.project_name}-{path_hash}"
+        # The 8-hex-char suffix also seeds the instance IP and veth name.
+        self._path_hash = self.instance_name[-8:]
+
+        # Created on first write (download / instance import), not here.
+        self.lenv_home    = Path.home() / ".lenv"
         self.rootfs_cache = self.lenv_home / "rootfs"
-        self.rootfs_cache.mkdir(exist_ok=True)
+
+        # Plain strings: these only ever get handed to wsl.exe / os calls.
+        self.instances_dir = os.path.join(str(self.lenv_home), "instances")
+        self.install_path  = os.path.join(self.instances_dir, self.instance_name)
 
         self.distro_set = distro_set
         self.rootfs_path = rootfs_path
         self.build = build                 # optional build name (lenv/builds/<name>.yaml)
         self.instance_ip = None            # filled after network setup
+        self._wsl_status = None            # cached `wsl --status` probe
 
     # ── Config ─────────────────────────────────────────────────────────────────
 
+    def _read_config(self):
+        """Parsed .lenv/config.json ({} if missing or unreadable), cached."""
+        if self._config is None:
+            self._config = {}
+            # One read instead of exists() + open(): no extra stat, no race.
+            try:
+                data = self.config_file.read_bytes()
+            except FileNotFoundError:
+                return self._config
+            self._config_found = True
+            try:
+                config = json.loads(data)
+            except ValueError:
+                return self._config
+            if isinstance(config, dict):
+                self._config = config
+        return self._config
+
     def _load_config(self):
-        if self.config_file.exists():
-            with open(self.config_file) as f:
-                config = json.load(f)
-            stored_name = config.get("instance_name")
-            # Only trust a stored instance name that matches the lenv naming
-            # scheme; otherwise fall back to the name computed from the path.
-            if stored_name and _INSTANCE_NAME_RE.fullmatch(stored_name):
-                self.instance_name = stored_name
-            self.distro_set  = config.get("distro", self.distro_set)
-            self.instance_ip = config.get("ip",     self.instance_ip)
-            self.build       = config.get("build",  self.build)
+        """Apply the stored config; returns False if there is none."""
+        # The stored instance name was already picked up in __init__.
+        config = self._read_config()
+        self.distro_set  = config.get("distro", self.distro_set)
+        self.instance_ip = config.get("ip",     self.instance_ip)
+        self.build       = config.get("build",  self.build)
+        return self._config_found
 
     # ── WSL helpers ────────────────────────────────────────────────────────────
 
+    def _wsl_status_cached(self):
+        """
+        Run `wsl --status` once per LENV instance and cache its
+        (returncode, decoded output); both WSL checks read from it.
+        returncode is None when wsl.exe is missing or timed out.
+        """
+        if self._wsl_status is None:
+            try:
+                result = subprocess.run(
+                    ["wsl", "--status"], capture_output=True, timeout=5,
+                    # no console-host allocation for the child on Windows
+                    creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+                )
+                raw = result.stdout
+                # wsl --status emits UTF-16 on Windows — decode it so the
+                # version check actually sees the text instead of garbage bytes.
+                output = (raw.decode("utf-16-le", errors="replace") if b"\x00" in raw
+                          else raw.decode("utf-8", errors="replace"))
+                self._wsl_status = (result.returncode, output)
+            except (FileNotFoundError, subprocess.TimeoutExpired):
+                self._wsl_status = (None, "")
+        return self._wsl_status
+
     def _check_wsl2_installed(self):
-        try:
-            result = subprocess.run(
-                ["wsl", "--status"], capture_output=True, text=True, timeout=5
-            )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+        return self._wsl_status_cached()[0] == 0
 
     def _check_wsl2_version(self):
-        # wsl --status emits UTF-16 on Windows — decode via _wsl_output so the
-        # version check actually sees the text instead of garbage bytes.
+        output = self._wsl_status_cached()[1].lower()
+        return "wsl 2" in output or "version: 2" in output or "version 2" in output
+
+    @staticmethod
+    def _run_elevated(exe, params):
+        """
+        Launch `exe` with a UAC prompt through one ShellExecuteW call, instead
+        of starting a whole PowerShell just to run Start-Process -Verb RunAs.
+        Returns False if ShellExecuteW is unavailable (caller falls back to
+        PowerShell); raises OSError if the launch fails or is declined.
+        """
+        if sys.platform != "win32":
+            return False
         try:
-            output = self._wsl_output(["--status"]).lower()
-            return "wsl 2" in output or "version: 2" in output or "version 2" in output
-        except Exception:
+            import ctypes
+            shell_execute = ctypes.windll.shell32.ShellExecuteW
+        except (ImportError, AttributeError, OSError):
             return False
+        # Return values <= 32 are error codes (5 = access denied / UAC declined)
+        rc = shell_execute(None, "runas", exe, params, None, 1)
+        if rc <= 32:
+            raise OSError(f"ShellExecuteW failed (code {rc})")
+        return True
 
     def _install_wsl2(self):
         print(" WSL2 is not installed on your system.")
@@ -108,11 +232,12 @@ class LENV:
             print("\n Attempting to install WSL2...")
             print("Note: This requires Administrator privileges.")
             try:
-                subprocess.run(
-                    ["powershell", "-Command", "Start-Process", "wsl",
-                     "-ArgumentList '--install --no-distribution'", "-Verb", "RunAs"],
-                    capture_output=True, text=True,
-                )
+                if not self._run_elevated("wsl.exe", "--install --no-distribution"):
+                    subprocess.run(
+                        ["powershell", "-Command", "Start-Process", "wsl",
+                         "-ArgumentList '--install --no-distribution'", "-Verb", "RunAs"],
+                        capture_output=True, text=True,
+                    )
                 print("\n WSL2 installation initiated.")
                 print("  You may need to restart your computer.")
                 print("After restart, run 'lenv init' again.")
@@ -133,6 +258,50 @@ class LENV:
             return raw.decode("utf-16-le", errors="replace")
         return raw.decode("utf-8", errors="replace")
 
+    def _wait_until_stopped(self, name):
+        """
+        After `wsl --terminate`, poll `wsl --list --running` with exponential
+        backoff (~5 s at most) until `name` is no longer listed. Usually
+        returns within the first poll or two instead of a fixed sleep.
+        A hung wsl.exe ends the wait early, so the caller still goes on to
+        --unregister/--import rather than dying on the poll.
+        """
+        for delay in (0.05, 0.1, 0.2, 0.4, 0.8, 1.6, 2.0):
+            try:
+                running = self._wsl_output(["--list", "--running", "--quiet"]).split()
+            except subprocess.TimeoutExpired:
+                return
+            if name not in running:
+                return
+            time.sleep(delay)
+
+    def _wsl_instances(self):
+        """
+        Parse `wsl --list --verbose` into {name: (state, version)} — one
+        wsl.exe call answers both "does it exist" and "is it running".
+        wsl.exe translates the header and STATE column into the display
+        language, so only the English Running/Stopped are read from the
+        table; any other state is settled with `wsl --list --running`.
+        """
+        instances, unknown = {}, False
+        lines = [l for l in self._wsl_output(["--list", "--verbose"]).splitlines() if l.strip()]
+        for line in lines[1:]:                  # first line is the header
+            parts = line.strip().lstrip("*").split()
+            if not parts:
+                continue
+            state   = parts[1] if len(parts) > 1 and parts[1] in ("Running", "Stopped") else None
+            version = parts[-1] if len(parts) > 2 and parts[-1].isdigit() else None
+            unknown = unknown or state is None
+            instances[parts[0]] = (state, version)
+
+        if unknown:
+            running = set(self._wsl_output(["--list", "--running", "--quiet"]).split())
+            instances = {
+                name: (state or ("Running" if name in running else "Stopped"), version)
+                for name, (state, version) in instances.items()
+            }
+        return instances
+
 
     # ── Distro choice ──────────────────────────────────────────────────────────
 
@@ -162,18 +331,40 @@ class LENV:
     # ── Rootfs download ────────────────────────────────────────────────────────
 
     def _format_size(self, size_bytes):
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024 or unit == 'TB':
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024
+        return _format_size(size_bytes)
 
     def _sha256_file(self, path):
+        import hashlib
         h = hashlib.sha256()
         with open(path, "rb") as f:
             for chunk in iter(lambda: f.read(1024 * 1024), b""):
                 h.update(chunk)
         return h.hexdigest()
 
+    def _sidecar_path(self, path):
+        return path.with_name(path.name + ".sha256")
+
+    def _recorded_sha256(self, path):
+        """
+        Digest stored in the `<file>.sha256` sidecar when `path` was last
+        verified, so a cache hit costs a tiny read instead of a full rehash.
+        Returns None if there is no sidecar or the file changed after it.
+        """
+        sidecar = self._sidecar_path(path)
+        try:
+            if sidecar.stat().st_mtime_ns < path.stat().st_mtime_ns:
+                return None
+            return sidecar.read_text(encoding="utf-8").split()[0].lower()
+        except (OSError, IndexError):
+            return None
+
+    def _record_sha256(self, path, digest):
+        """Write a sha256sum-style sidecar next to a verified rootfs."""
+        try:
+            self._sidecar_path(path).write_text(f"{digest}  {path.name}\n", encoding="utf-8")
+        except OSError:
+            pass     # the sidecar is only an optimisation
+
     def _fetch_expected_sha256(self, info):
         """
         Fetch the upstream SHA-256 checksum for a rootfs.
@@ -212,6 +403,172 @@ class LENV:
         print(f"Using custom rootfs ({self._format_size(path.stat().st_size)})")
         return str(path)
 
+    def _download_with_tool(self, url, dest):
+        """
+        Download `url` into `dest` with curl or wget when one is on PATH
+        (curl.exe ships with Windows 10+). Native tools move bytes to disk far
+        faster than a Python read loop and draw their own progress meter on
+        the inherited stderr. Returns False if neither tool is available or
+        the tool fails, so the caller falls back to the Python download path.
+        """
+        import shutil
+        curl = shutil.which("curl")
+        if curl:
+            # --retry alone doesn't retry a connection dropped mid-transfer;
+            # --retry-all-errors with --continue-at - resumes it instead.
+            cmd = [curl, "-fL", "--retry", "3", "--retry-all-errors",
+                   "--continue-at", "-", "-o", str(dest), url]
+        else:
+            wget = shutil.which("wget")
+            if not wget:
+                return False
+            cmd = [wget, "-c", "-O", str(dest), url]
+        try:
+            subprocess.run(cmd, check=True)
+        except subprocess.CalledProcessError as e:
+            # Also covers an old curl.exe that predates --retry-all-errors.
+            print(f"\n   {os.path.basename(cmd[0])} failed (exit {e.returncode}) - "
+                  "retrying with the built-in downloader...")
+            return False
+        return True
+
+    def _stream_download(self, url, dest):
+        """
+        Stream `url` into `dest` with large buffered reads. If the connection
+        drops mid-transfer (urlretrieve's ContentTooShortError case), reconnect
+        with a Range header and continue from the last byte written.
+        """
+        import http.client       # lazy: download path only
+        import urllib.error
+        import urllib.request
+
+        done, total = 0, None
+        progress = _Progress()
+        failures = 0
+        with open(dest, "wb") as f:
+            while True:
+                # identity: Content-Length must describe the bytes on disk
+                headers = {"Accept-Encoding": "identity"}
+                if done:
+                    headers["Range"] = f"bytes={done}-"
+                req = urllib.request.Request(url, headers=headers)
+                try:
+                    with urllib.request.urlopen(req, timeout=30) as resp:
+                        if done and resp.status != 206:
+                            # Server ignored the Range header - start over.
+                            f.seek(0)
+                            done = 0
+                            progress = _Progress(total)
+                        length = resp.headers.get("Content-Length")
+                        if total is None and length:
+                            total = progress.total = done + int(length)
+                            _preallocate(f, total)
+
+                        while True:
+                            chunk = resp.read(_DOWNLOAD_CHUNK)
+                            if not chunk:
+                                break
+                            f.write(chunk)
+                            done += len(chunk)
+                            progress.add(len(chunk))
+
+                    if total is None or done >= total:
+                        f.truncate(done)
+                        return
+                    raise http.client.IncompleteRead(b"", total - done)
+                except urllib.error.HTTPError:
+                    raise                       # the server refused - don't retry
+                except (OSError, http.client.HTTPException) as e:
+                    failures += 1
+                    if failures > _DOWNLOAD_RETRIES:
+                        raise
+                    print(f"\n   Connection interrupted ({e}) - resuming at "
+                          f"{self._format_size(done)}...")
+
+    def _probe_ranges(self, url):
+        """
+        Ask for the first byte of `url`. Returns the full size if the server
+        answers 206 with a Content-Range total (i.e. honours byte ranges),
+        otherwise None.
+        """
+        import urllib.request   # lazy: download path only
+        req = urllib.request.Request(
+            url, headers={"Range": "bytes=0-0", "Accept-Encoding": "identity"}
+        )
+        try:
+            with urllib.request.urlopen(req, timeout=30) as resp:
+                content_range = resp.headers.get("Content-Range", "")
+                if resp.status != 206 or resp.headers.get("Accept-Ranges", "bytes") == "none":
+                    return None
+        except Exception:
+            return None
+        m = re.fullmatch(r"bytes 0-0/(\d+)", content_range.strip())
+        return int(m.group(1)) if m else None
+
+    def _parallel_download(self, url, dest):
+        """
+        Fetch `url` into `dest` as _DOWNLOAD_CONNECTIONS concurrent ranged GETs,
+        each writing its slice at its own offset. Returns False (having written
+        nothing) when the server doesn't support ranges or the file is too
+        small to benefit, so the caller can fall back to _stream_download.
+        """
+        total = self._probe_ranges(url)
+        if not total or total < _PARALLEL_MIN_BYTES:
+            return False
+
+        import http.client      # lazy: download path only
+        import urllib.error
+        import urllib.request
+        from concurrent.futures import ThreadPoolExecutor
+
+        progress = _Progress(total)
+        span   = -(-total // _DOWNLOAD_CONNECTIONS)       # ceil division
+        ranges = [(start, min(start + span, total) - 1) for start in range(0, total, span)]
+        failed = threading.Event()      # tells the other workers to stop early
+
+        with open(dest, "wb") as f:
+            _preallocate(f, total)
+
+        def fetch(start, end):
+            # Like _stream_download: a dropped connection re-requests the rest
+            # of this slice (bytes=pos-end) up to _DOWNLOAD_RETRIES times.
+            pos, failures = start, 0
+            with open(dest, "r+b") as f:
+                while pos <= end and not failed.is_set():
+                    req = urllib.request.Request(
+                        url, headers={"Range": f"bytes={pos}-{end}", "Accept-Encoding": "identity"}
+                    )
+                    try:
+                        with urllib.request.urlopen(req, timeout=30) as resp:
+                            if resp.status != 206:
+                                raise ValueError(f"server ignored range request (HTTP {resp.status})")
+                            f.seek(pos)
+                            while pos <= end and not failed.is_set():
+                                chunk = resp.read(min(_DOWNLOAD_CHUNK, end + 1 - pos))
+                                if not chunk:
+                                    break
+                                f.write(chunk)
+                                pos += len(chunk)
+                                progress.add(len(chunk))
+                        if pos <= end and not failed.is_set():
+                            raise http.client.IncompleteRead(b"", end + 1 - pos)
+                    except urllib.error.HTTPError:
+                        failed.set()
+                        raise                   # the server refused - don't retry
+                    except (OSError, http.client.HTTPException):
+                        failures += 1
+                        if failures > _DOWNLOAD_RETRIES:
+                            failed.set()
+                            raise
+                    except Exception:
+                        failed.set()
+                        raise
+
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            for future in [pool.submit(fetch, start, end) for start, end in ranges]:
+                future.result()     # re-raise the first failure, if any
+        return True
+
     def _download_rootfs(self):
         """Download minimal Linux rootfs, with SHA-256 integrity verification."""
         if self.rootfs_path:
@@ -222,12 +579,14 @@ class LENV:
                 "url": "https://dl-cdn.alpinelinux.org/alpine/v3.19/releases/x86_64/alpine-minirootfs-3.19.0-x86_64.tar.gz",
                 "filename": "alpine-minirootfs-3.19.0-x86_64.tar.gz",
                 "size_mb": 3,
+                "min_bytes": 2 * 1024 * 1024,
                 "sha256_url": "https://dl-cdn.alpinelinux.org/alpine/v3.19/releases/x86_64/alpine-minirootfs-3.19.0-x86_64.tar.gz.sha256",
             },
             "ubuntu": {
                 "url": "https://cloud-images.ubuntu.com/minimal/releases/jammy/release/ubuntu-22.04-minimal-cloudimg-amd64-root.tar.xz",
                 "filename": "ubuntu-22.04-minimal-cloudimg-amd64-root.tar.xz",
                 "size_mb": 50,
+                "min_bytes": 20 * 1024 * 1024,
                 "sha256_url": "https://cloud-images.ubuntu.com/minimal/releases/jammy/release/SHA256SUMS",
             },
         }
@@ -241,16 +600,39 @@ class LENV:
 
 
         info = rootfs_urls[self.distro_set]
+        self.rootfs_cache.mkdir(parents=True, exist_ok=True)
         rootfs_path = self.rootfs_cache / info["filename"]
         expected = self._fetch_expected_sha256(info)
 
-        if rootfs_path.exists():
+        # A cached file far below the expected size is a leftover from a
+        # crashed run: drop it (and its sidecar) without hashing it.
+        try:
+            cached_size = os.stat(rootfs_path).st_size
+        except FileNotFoundError:
+            cached_size = None
+        if cached_size is not None and cached_size < info["min_bytes"]:
+            print(f"  Cached rootfs is truncated ({self._format_size(cached_size)}) - re-downloading.")
+            rootfs_path.unlink()
+            self._sidecar_path(rootfs_path).unlink(missing_ok=True)
+            cached_size = None
+
+        if cached_size is not None:
+            recorded = self._recorded_sha256(rootfs_path)
             if expected:
+                if recorded == expected:
+                    print(f"Using cached {self.distro_set} rootfs (checksum verified)")
+                    return str(rootfs_path)
                 if self._sha256_file(rootfs_path) == expected:
+                    self._record_sha256(rootfs_path, expected)
                     print(f"Using cached {self.distro_set} rootfs (checksum verified)")
                     return str(rootfs_path)
                 print("  Cached rootfs failed checksum verification - re-downloading.")
                 rootfs_path.unlink()
+                self._sidecar_path(rootfs_path).unlink(missing_ok=True)
+            elif recorded:
+                print("  Warning: checksum unavailable, using cached rootfs "
+                      "(verified when it was downloaded).")
+                return str(rootfs_path)
             else:
                 print("  Warning: checksum unavailable, using cached rootfs unverified.")
                 return str(rootfs_path)
@@ -264,25 +646,18 @@ class LENV:
         print(f"Downloading {self.distro_set} rootfs (~{info['size_mb']}MB)...")
         print(f"   From: {info['url']}")
 
-        def reporthook(count, block_size, total_size):
-            if total_size and total_size > 0:
-                percent = min(100, int(count * block_size * 100 / total_size))
-                sys.stdout.write(f"\r   Progress: {percent}%")
-            else:
-                sys.stdout.write(f"\r   Downloaded: {self._format_size(count * block_size)}")
-            sys.stdout.flush()
-
         # Download to a temp file first so a failed/partial download can never
         # be mistaken for a valid cached rootfs on the next run.
-        # Lazy imports: both are only needed on the download path.
+        # Lazy import: only needed on the download path.
         import tempfile
-        import urllib.request
         fd, tmp_name = tempfile.mkstemp(dir=self.rootfs_cache, prefix=".dl-", suffix=".part")
         os.close(fd)
         tmp_path = Path(tmp_name)
 
         try:
-            urllib.request.urlretrieve(info["url"], tmp_name, reporthook=reporthook)
+            if not self._download_with_tool(info["url"], tmp_name):
+                if not self._parallel_download(info["url"], tmp_name):
+                    self._stream_download(info["url"], tmp_name)
             print("\n Download complete")
         except Exception as e:
             tmp_path.unlink(missing_ok=True)
@@ -299,6 +674,7 @@ class LENV:
 
         print(" SHA-256 checksum verified")
         tmp_path.replace(rootfs_path)   # atomic move within the same directory
+        self._record_sha256(rootfs_path, expected)
         return str(rootfs_path)
 
     # ── Builds (bundled package sets) ───────────────────────────────────────────
@@ -374,9 +750,12 @@ class LENV:
         """Interface names are capped at 15 chars in Linux."""
         return f"vlenv-{self._path_hash[:6]}"      # 12 chars
 
-    def _setup_network(self):
+    def _network_script(self):
         """
-        Create a veth pair for this instance and attach it to the lenv bridge.
+        Shell script that creates a veth pair for this instance and attaches it
+        to the lenv bridge. It only touches local kernel state, so
+        _configure_instance runs it while the package index refresh is still
+        downloading in the background.
         All lenv instances share the same WSL2 kernel network namespace, so the
         bridge is visible to every instance — each just gets its own veth + IP.
 
@@ -388,10 +767,9 @@ class LENV:
                     │     └── vlenv-YYYYYY-br    ← bridge end of veth pair B
                     ├── vlenv-XXXXXX  (10.100.x.y)  ← instance A's interface
                     └── vlenv-YYYYYY  (10.100.a.b)  ← instance B's interface
-        """
-        print(" Setting up network isolation...")
 
-        self.instance_ip = self._assign_ip()
+        Uses self.instance_ip, which the caller assigns first.
+        """
         veth      = self._veth_name()          # vlenv-abc123
         veth_br   = f"{veth}-br"              # vlenv-abc123-br  (14 chars)
 
@@ -399,9 +777,11 @@ class LENV:
         # NOTE: No 'set -e' — every step is independent and idempotent
         # All interpolated values are lenv-generated (hex hashes, computed IPs),
         # never raw user input.
-        script = f"""
+        return f"""
 # ── 1. Install networking tools if missing ──────────────────────────────
+# (after any background package index refresh has finished)
 if ! command -v ip > /dev/null 2>&1; then
+    wait
     if command -v apk > /dev/null 2>&1; then
         apk add --quiet iproute2 iptables 2>/dev/null
     elif command -v apt-get > /dev/null 2>&1; then
@@ -458,17 +838,6 @@ printf '%s\n' \
 chmod +x /etc/profile.d/lenv-net.sh
 """
 
-        shell = "bash" if self.distro_set == "ubuntu" else "ash"
-        result = subprocess.run(
-            ["wsl", "-d", self.instance_name, "--", shell, "-c", script],
-            capture_output=True, text=True,
-        )
-
-        if result.returncode != 0:
-            print(f"  Warning: Network setup had errors:\n  {result.stderr.strip()}")
-        else:
-            print(f" Network ready — instance IP: {self.instance_ip}")
-
     def _teardown_network(self):
         """Remove the veth pair for this instance from the bridge."""
         veth    = self._veth_name()
@@ -496,9 +865,8 @@ ip link del {veth_br} 2>/dev/null || true
             print("Setting WSL 2 as default...")
             subprocess.run(["wsl", "--set-default-version", "2"])
 
-        rootfs_tar   = self._download_rootfs()
-        install_path = str(self.lenv_home / "instances" / self.instance_name)
-        Path(install_path).mkdir(parents=True, exist_ok=True)
+        rootfs_tar = self._download_rootfs()
+        os.makedirs(self.install_path, exist_ok=True)
 
         print(f"Creating WSL instance '{self.instance_name}'...")
 
@@ -506,7 +874,7 @@ ip link del {veth_br} 2>/dev/null || true
         # otherwise the "already exists" check never matches and the error
         # message prints as garbage.
         result = subprocess.run(
-            ["wsl", "--import", self.instance_name, install_path, rootfs_tar],
+            ["wsl", "--import", self.instance_name, self.install_path, rootfs_tar],
             capture_output=True,
         )
         stderr = result.stderr
@@ -555,19 +923,105 @@ ip link del {veth_br} 2>/dev/null || true
                         f"--no-install-recommends {pkgs}"
                     )
 
-        for cmd in commands:
-            result = subprocess.run(
-                ["wsl", "-d", self.instance_name, "--", shell_rcd, "-c", cmd],
-                capture_output=True, text=True,
-            )
-            if result.returncode != 0:
-                print(f"  Warning: Command failed: {cmd}")
-                print(f"   {result.stderr}")
+        # Everything runs in ONE wsl.exe invocation (each spawn is a process
+        # launch plus a VM round trip). The index refresh is network-bound, so
+        # it runs in the background while the local-only network setup goes
+        # ahead; the installs wait for it. 'set -e' stops at the first failed
+        # package step and the ::step:: markers on stdout say which one it was.
+        # The script is streamed over stdin rather than passed to 'sh -c': no
+        # command-line length limit, and wsl.exe doesn't pre-expand its $VARs.
+        # Commands read </dev/null so none of them can swallow the script.
+        debug = bool(os.environ.get("LENV_DEBUG"))
+        lines = ["set -e"]
+        if debug:
+            lines.append("set -x")
+        if commands:
+            refresh = commands[0]
+            # Status goes through a flag file, not 'wait $!': the network
+            # script may already have reaped the job with a bare 'wait', and
+            # ash/dash forget a reaped job's exit status.
+            lines += [
+                "rm -f /tmp/.lenv-refresh.failed",
+                f"( {refresh} || touch /tmp/.lenv-refresh.failed ) < /dev/null > /tmp/.lenv-refresh.log 2>&1 &",
+            ]
+        # -e is ignored inside a group that is followed by '||', so the
+        # independent network steps are never cut short by one failing.
+        # Its stderr goes to a log that is replayed (as ::network-log:: lines
+        # on stdout) only if the group fails. Success is reported positively
+        # with ::network-done::, so a shell that never got this far (distro
+        # failed to start, no ash in a custom rootfs) counts as a failure.
+        self.instance_ip = self._assign_ip()
+        lines += [
+            "{", self._network_script() + "} < /dev/null 2> /tmp/.lenv-net.log && "
+            "echo '::network-done::' || "
+            "{ echo '::network-failed::'; sed 's/^/::network-log::/' /tmp/.lenv-net.log; }",
+        ]
+        if commands:
+            lines += [
+                f"echo '::step::{refresh}'",
+                "wait",
+                "if [ -e /tmp/.lenv-refresh.failed ]; then cat /tmp/.lenv-refresh.log >&2; exit 1; fi",
+            ]
+            for cmd in commands[1:]:
+                lines += [f"echo '::step::{cmd}'", f"{cmd} < /dev/null"]
+        script = ("\n".join(lines) + "\n").encode()
+
+        print(" Setting up network isolation...")
+
+        # Popen instead of run(): each ::step:: marker is reported as soon as
+        # the shell reaches it, rather than after the whole batch has exited.
+        # Helper threads feed stdin and drain stderr so no pipe can fill up
+        # and stall the child while we are reading stdout. With LENV_DEBUG,
+        # stderr (and so the 'set -x' trace) goes straight to the terminal.
+        proc = subprocess.Popen(
+            ["wsl", "-d", self.instance_name, "--", shell_rcd],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=None if debug else subprocess.PIPE,
+            bufsize=1 << 16,
+        )
+        stderr_chunks = []
+
+        def feed():
+            try:
+                proc.stdin.write(script)
+                proc.stdin.close()
+            except OSError:
+                pass        # shell exited early; its exit code says why
+
+        helpers = [threading.Thread(target=feed, daemon=True)]
+        if proc.stderr:
+            helpers.append(threading.Thread(
+                target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True))
+        for t in helpers:
+            t.start()
+
+        step, network_done, network_log = None, False, []
+        for raw in proc.stdout:
+            line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+            if line.startswith("::step::"):
+                step = line[len("::step::"):]
+                print(f"   -> {step}")
+            elif line == "::network-done::":
+                network_done = True
+            elif line.startswith("::network-log::"):
+                network_log.append(line[len("::network-log::"):])
+        returncode = proc.wait()
+        for t in helpers:
+            t.join()
+
+        if returncode != 0:
+            stderr = (b"".join(stderr_chunks).decode("utf-8", errors="replace")
+                      if proc.stderr else "(see the output above)")
+            print(f"  Warning: Command failed: {step or 'instance setup script'}")
+            print(f"   {stderr}")
 
         print("Configuration complete")
 
-        # ── Network isolation (applies to every distro, including custom) ──
-        self._setup_network()
+        if network_done:
+            print(f" Network ready — instance IP: {self.instance_ip}")
+        else:
+            details = "\n  ".join(network_log).strip() or "setup script exited before it ran"
+            print(f"  Warning: Network setup had errors:\n  {details}")
 
     # ── Public commands ────────────────────────────────────────────────────────
 
@@ -591,11 +1045,11 @@ ip link del {veth_br} 2>/dev/null || true
             "distro":        self.distro_set,
             "ip":            self.instance_ip,        # ← persisted IP
             "build":         self.build,
-            "created_at":    datetime.now(timezone.utc).isoformat(),
+            "created_at":    int(time.time()),   # formatted only when shown
         }
 
-        with open(self.config_file, "w") as f:
-            json.dump(config, f, indent=2)
+        self.config_file.write_text(json.dumps(config, indent=2))
+        self._config, self._config_found = config, True
 
         # BUG FIX: project_path is a str, must wrap in Path() before using /
         gitignore = Path(self.project_path) / ".gitignore"
@@ -616,19 +1070,19 @@ ip link del {veth_br} 2>/dev/null || true
         print(f"\nNext steps:")
         print(f"  lenv activate    # Enter Linux environment")
 
-    def _windows_to_wsl_path(self, windows_path):
-        path  = Path(windows_path).absolute()
+    @functools.cached_property
+    def wsl_project_path(self):
+        """The project directory as seen from inside WSL (/mnt/<drive>/...)."""
+        path  = self._project_abs
         drive = path.drive.lower().replace(":", "")
         rest  = str(path).replace(path.drive, "").replace("\\", "/")
         return f"/mnt/{drive}{rest}"
 
     def activate(self):
-        if not self.config_file.exists():
+        if not self._load_config():
             print("No LENV environment found. Run 'lenv init' first.")
             return
-        self._load_config()
 
-        wsl_path  = self._windows_to_wsl_path(self.project_path)
         shell_rcd = "bash" if self.distro_set == "ubuntu" else "ash"
 
         print(f"Entering Linux environment '{self.instance_name}'...")
@@ -638,42 +1092,98 @@ ip link del {veth_br} 2>/dev/null || true
 
         subprocess.run([
             "wsl", "-d", self.instance_name,
-            "--cd", wsl_path, "--", shell_rcd,
+            "--cd", self.wsl_project_path, "--", shell_rcd,
         ])
 
         print("Exited Linux environment")
 
-    def run(self, command):
-        if not self.config_file.exists():
+    def run(self, command, capture=False):
+        """
+        Run `command` inside the environment and return its exit code.
+        Output goes straight to the caller's terminal (the child inherits our
+        stdout/stderr), so long-running commands show progress live. With
+        capture=True, returns a (returncode, stdout, stderr) tuple of
+        (int, str, str) instead; output from the Linux side is decoded as
+        UTF-8 with undecodable bytes replaced.
+        """
+        if not self._load_config():
             print("No LENV environment found. Run 'lenv init' first.")
-            return 1
-        self._load_config()
+            return (1, "", "") if capture else 1
 
-        wsl_path  = self._windows_to_wsl_path(self.project_path)
         shell_rcd = "bash" if self.distro_set == "ubuntu" else "ash"
 
-        result = subprocess.run(
+        argv = ["wsl", "-d", self.instance_name,
+                "--cd", self.wsl_project_path, "--", shell_rcd, "-c", command]
+        if capture:
+            result = subprocess.run(argv, capture_output=True,
+                                    encoding="utf-8", errors="replace")
+            return result.returncode, result.stdout, result.stderr
+
+        return subprocess.run(argv).returncode
+
+    def run_many(self, commands):
+        """
+        Run several commands through ONE wsl.exe shell instead of paying a
+        wsl.exe spawn per run() call, and return their exit codes in order.
+        Each command runs in its own subshell with stdin from /dev/null, so
+        `exit`/`cd` behave as they would under run(); output streams to the
+        terminal as it is produced.
+        """
+        commands = list(commands)
+        if not self._load_config():
+            print("No LENV environment found. Run 'lenv init' first.")
+            return [1] * len(commands)
+        if not commands:
+            return []
+
+        shell_rcd = "bash" if self.distro_set == "ubuntu" else "ash"
+        # Random per call, so command output can't fake a return-code line.
+        token  = f"__LENV_RC_{os.urandom(4).hex()}_"
+        script = "".join(f"( {cmd}\n) < /dev/null\necho \"{token}$?__\"\n" for cmd in commands)
+
+        proc = subprocess.Popen(
             ["wsl", "-d", self.instance_name,
-             "--cd", wsl_path, "--", shell_rcd, "-c", command],
-            capture_output=True, text=True,
+             "--cd", self.wsl_project_path, "--", shell_rcd],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
         )
 
-        print(result.stdout)
-        if result.stderr:
-            print(result.stderr)
+        def feed():
+            try:
+                proc.stdin.write(script.encode())
+                proc.stdin.close()
+            except OSError:
+                pass        # shell exited early; missing codes are filled below
+
+        feeder = threading.Thread(target=feed, daemon=True)
+        feeder.start()
+
+        codes = []
+        rc_re = re.compile(re.escape(token) + r"(\d+)__")
+        for raw in proc.stdout:
+            line = raw.decode("utf-8", errors="replace")
+            m = rc_re.search(line)
+            if m:
+                # Output without a trailing newline shares the marker's line.
+                if m.start():
+                    print(line[:m.start()])
+                codes.append(int(m.group(1)))
+            else:
+                sys.stdout.write(line)
+                sys.stdout.flush()
+        returncode = proc.wait()
+        feeder.join()
 
-        return result.returncode
+        # A shell that died early (e.g. a syntax error) reports its own exit
+        # code for every command that never ran.
+        codes += [returncode or 1] * (len(commands) - len(codes))
+        return codes
 
     def destroy(self, assume_yes=False):
-        if not self.config_file.exists():
+        if not self._load_config():
             print("No LENV environment found")
             return
-        self._load_config()
 
-        with open(self.config_file) as f:
-            config = json.load(f)
-
-        instance_name = config.get("instance_name", self.instance_name)
+        instance_name = self._read_config().get("instance_name", self.instance_name)
 
         # Never unregister anything that is not a lenv-managed instance name.
         # A tampered .lenv/config.json must not be able to wipe an unrelated
@@ -700,19 +1210,20 @@ ip link del {veth_br} 2>/dev/null || true
             ["wsl", "--terminate", instance_name],
             capture_output=True, timeout=10,
         )
-        time.sleep(2)
+        self._wait_until_stopped(instance_name)
 
         subprocess.run(
             ["wsl", "--unregister", instance_name],
             capture_output=True, text=True, timeout=20,
         )
 
+        import shutil   # lazy: only destroy removes directories
         if self.config_dir.exists():
             shutil.rmtree(self.config_dir)
 
         # Also drop the install directory (~/.lenv/instances/<name>) left behind
-        install_dir = self.lenv_home / "instances" / instance_name
-        if install_dir.exists():
+        install_dir = os.path.join(self.instances_dir, instance_name)
+        if os.path.exists(install_dir):
             shutil.rmtree(install_dir, ignore_errors=True)
 
         print(f"Destroyed environment: {instance_name}")
@@ -738,12 +1249,11 @@ ip link del {veth_br} 2>/dev/null || true
         that disabled (current builds do, over corruption concerns), rebuilds
         the disk via export/re-import, which needs no elevation.
         """
-        if not self.config_file.exists():
+        if not self._load_config():
             print("No LENV environment found")
             return
-        self._load_config()
 
-        vhdx = self.lenv_home / "instances" / self.instance_name / "ext4.vhdx"
+        vhdx = Path(self.install_path) / "ext4.vhdx"
         if not vhdx.exists():
             print(f"No virtual disk found at {vhdx}")
             return
@@ -754,7 +1264,7 @@ ip link del {veth_br} 2>/dev/null || true
         # The VHDX must not be attached while it is modified
         subprocess.run(["wsl", "--terminate", self.instance_name],
                        capture_output=True, timeout=10)
-        time.sleep(1)
+        self._wait_until_stopped(self.instance_name)
 
         result = subprocess.run(
             ["wsl", "--manage", self.instance_name, "--set-sparse", "true"],
@@ -819,19 +1329,18 @@ ip link del {veth_br} 2>/dev/null || true
             # 2. Rebuild the disk from the archive.
             subprocess.run(["wsl", "--terminate", self.instance_name],
                            capture_output=True, timeout=10)
-            time.sleep(1)
+            self._wait_until_stopped(self.instance_name)
             subprocess.run(["wsl", "--unregister", self.instance_name],
                            capture_output=True, timeout=30)
-            install_path = str(self.lenv_home / "instances" / self.instance_name)
             result = subprocess.run(
-                ["wsl", "--import", self.instance_name, install_path, str(tar)],
+                ["wsl", "--import", self.instance_name, self.install_path, str(tar)],
                 capture_output=True, timeout=3600,
             )
             if result.returncode != 0:
                 print("  Re-import FAILED. Your data is safe in this archive:")
                 print(f"    {tar}")
                 print(f"  Restore with: wsl --import {self.instance_name} "
-                      f"\"{install_path}\" \"{tar}\"")
+                      f"\"{self.install_path}\" \"{tar}\"")
                 return
         finally:
             if tar.exists() and self.instance_name in self._wsl_output(["--list", "--quiet"]):
@@ -842,17 +1351,8 @@ ip link del {veth_br} 2>/dev/null || true
 
 
     def list_instances(self):
-        result = self._wsl_output(["--list", "--verbose"])
-        rows = []
-        for line in result.splitlines():
-            line = line.strip().lstrip("*").strip()
-            if not line.startswith("lenv-"):
-                continue
-
-            parts = line.split()
-            name = parts[0]
-            state = parts[1] if len(parts)>1 else "Unknown"
-            rows.append((name, state))
+        rows = [(name, state) for name, (state, _) in self._wsl_instances().items()
+                if name.startswith("lenv-")]
 
         if not rows:
             print("No lenv environments found on this machine.")
@@ -865,11 +1365,11 @@ ip link del {veth_br} 2>/dev/null || true
 
 
     def status(self):
-        self._load_config()
+        found = self._load_config()
         print(f"Project:  {self.project_name}")
         print(f"Path:     {self.project_path}")
 
-        if not self.config_file.exists():
+        if not found:
             print("Status:   Not initialized")
             return
 
@@ -881,11 +1381,20 @@ ip link del {veth_br} 2>/dev/null || true
         if self.build:
             print(f"Build:    {self.build}")
 
+        created = self._read_config().get("created_at")
+        if isinstance(created, (int, float)):
+            from datetime import datetime, timezone   # lazy: display only
+            created = datetime.fromtimestamp(created, tz=timezone.utc).isoformat()
+        if created:
+            # configs written by older versions already hold an ISO string
+            print(f"Created:  {created}")
+
 
-        if self.instance_name in self._wsl_output(["--list", "--quiet"]):
+        instance = self._wsl_instances().get(self.instance_name)
+        if instance:
             print(f"WSL Instance:  {self.instance_name}")
 
-            if self.instance_name in self._wsl_output(["--list", "--running"]):
+            if instance[0] == "Running":
                 print("State:    Running")
             else:
                 print("State:    Stopped")